@@ -2,34 +2,125 @@
 Simple AWS Client Management
 """
 
+import os
+import threading
+from collections.abc import Mapping
+from typing import Optional
+
 import boto3
+from botocore.config import Config
+
 from .utils import logger
-from .services import SERVICE_CONFIGS
+from .services import SERVICE_CONFIGS, build_arn_templates
+
+# Shared client config: adaptive retries absorb throttling on bulk tagging
+_BOTO_CFG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    user_agent_extra="aws-tagger/1.0",
+)
+
+# Global services are served from us-east-1 whatever the tagger's region.
+# S3 stays regional: buckets in this region's trail live in this region.
+_GLOBAL_SERVICES = {"iam", "route53", "cloudfront"}
+_GLOBAL_REGION = "us-east-1"
+
+# Keys used by the tagger that are not boto3 service names
+_CLIENT_ALIASES = {"cloudwatch-logs": "logs"}
+
+# Non-client entries exposed alongside the clients
+_METADATA_KEYS = ("region", "account_id", "arns")
+
+
+class LazyClients(Mapping):
+    """Mapping of AWS clients that are only built on first access"""
+
+    def __init__(self, session: boto3.Session, region: str, account_id: str):
+        self.session = session
+        self.region = region
+        self.account_id = account_id
+        # ARN templates with region/account filled in once, not per tag call
+        self.arns = build_arn_templates(region, account_id)
+        self._cache = {}
+        # boto3 sessions are not thread-safe, so client creation is serialized
+        self._lock = threading.Lock()
+        self._keys = tuple(
+            dict.fromkeys(
+                [
+                    *SERVICE_CONFIGS,
+                    *_CLIENT_ALIASES,
+                    "cloudtrail",
+                    "resourcegroupstaggingapi",
+                ]
+            )
+        )
+
+    def __getitem__(self, key):
+        if key in _METADATA_KEYS:
+            return getattr(self, key)
+
+        if key not in self._keys:
+            raise KeyError(key)
 
+        # Aliases share the client of the service they point to
+        key = _CLIENT_ALIASES.get(key, key)
+        client = self._cache.get(key)
+        if client is None:
+            with self._lock:
+                client = self._cache.get(key)
+                if client is None:
+                    client = self._cache[key] = self._create_client(key)
+        return client
 
-def get_clients(region: str) -> dict:
-    """Get all AWS clients - simple and clean"""
+    def _create_client(self, key):
+        """Build the boto3 client for a service key"""
+        logger.debug("Creating AWS client: %s", key)
+        region_name = _GLOBAL_REGION if key in _GLOBAL_SERVICES else self.region
+        return self.session.client(key, region_name=region_name, config=_BOTO_CFG)
 
-    logger.debug(f"Initializing AWS clients for region: {region}")
+    def __contains__(self, key):
+        # Avoid Mapping's default, which would build the client to check
+        return key in self._keys or key in _METADATA_KEYS
+
+    def __iter__(self):
+        yield from self._keys
+        yield from _METADATA_KEYS
+
+    def __len__(self):
+        return len(self._keys) + len(_METADATA_KEYS)
+
+
+# Account ID resolved by the first get_clients call, reused for the process
+_ACCOUNT_ID = None
+
+
+def _account_id(session: boto3.Session) -> str:
+    """Resolve the AWS account ID once per process, via the given session"""
+    global _ACCOUNT_ID
+    if _ACCOUNT_ID is None:
+        _ACCOUNT_ID = os.getenv("AWS_ACCOUNT_ID")
+    if not _ACCOUNT_ID:
+        sts = session.client("sts", config=_BOTO_CFG)
+        _ACCOUNT_ID = sts.get_caller_identity()["Account"]
+    return _ACCOUNT_ID
+
+
+def get_clients(region: str, account_id: Optional[str] = None) -> LazyClients:
+    """Get all AWS clients - built lazily on first use"""
+
+    logger.debug("Initializing AWS clients for region: %s", region)
 
     try:
+        # One session shares credentials and loaded service models
+        session = boto3.Session(region_name=region)
+
         # Get account ID once
-        sts = boto3.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
-        logger.debug(f"Using AWS account: {account_id}")
-
-        client_keys = list(SERVICE_CONFIGS.keys())
-
-        return {
-            client_key: boto3.client(client_key, region_name=region)
-            for client_key in client_keys
-        } | {
-            "cloudtrail": boto3.client("cloudtrail", region_name=region),
-            # Metadata
-            "region": region,
-            "account_id": account_id,
-        }
+        account_id = account_id or _account_id(session)
+        logger.debug("Using AWS account: %s", account_id)
+
+        return LazyClients(session, region, account_id)
 
     except Exception as e:
-        logger.error(f"Failed to initialize AWS clients: {e}")
+        logger.error("Failed to initialize AWS clients: %s", e)
         raise
@@ -5,12 +5,24 @@ This module contains all dataclasses used as return types and data structures
 throughout the application.
 """
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+def _workers_from_env() -> int:
+    """Read the default worker count from AWS_TAGGER_WORKERS"""
+    value = os.getenv("AWS_TAGGER_WORKERS", "16")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(
+            f"AWS_TAGGER_WORKERS must be a positive integer, got {value!r}"
+        ) from None
+
+
+@dataclass(slots=True)
 class TaggingStats:
     """Statistics from a tagging operation"""
 
@@ -33,7 +45,7 @@ class TaggingStats:
         return (self.errors / self.processed) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceInfo:
     """Information about a discovered resource"""
 
@@ -46,7 +58,7 @@ class ResourceInfo:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EventProcessingResult:
     """Result of processing CloudTrail events"""
 
@@ -55,14 +67,19 @@ class EventProcessingResult:
     start_time: datetime
     end_time: datetime
     region: str
+    # time.monotonic() readings; unaffected by wall-clock adjustments
+    start_ts: Optional[float] = None
+    end_ts: Optional[float] = None
 
     @property
     def duration_seconds(self) -> float:
         """Calculate processing duration in seconds"""
+        if self.start_ts is not None and self.end_ts is not None:
+            return self.end_ts - self.start_ts
         return (self.end_time - self.start_time).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractorConfig:
     """Configuration for resource extractors"""
 
@@ -75,7 +92,7 @@ class ExtractorConfig:
     extraction_function: Optional[callable] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CloudTrailEventSummary:
     """Summary of CloudTrail events retrieved"""
 
@@ -87,7 +104,7 @@ class CloudTrailEventSummary:
     end_time: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TaggingConfig:
     """Configuration for resource tagging behavior"""
 
@@ -96,7 +113,17 @@ class TaggingConfig:
     creation_time_format: str = "%Y-%m-%d %H:%M:%S UTC"
     include_creation_time: bool = True
     additional_tags: dict = None
+    # Concurrent tagging API calls, overridable via AWS_TAGGER_WORKERS
+    max_workers: int = field(default_factory=_workers_from_env)
+    # Build a ResourceInfo per tagged resource for the result; callers that
+    # only need the stats can turn this off
+    collect_resources: bool = True
 
     def __post_init__(self):
         if self.additional_tags is None:
             self.additional_tags = {}
+        if self.max_workers < 1:
+            raise ValueError(
+                "max_workers (or AWS_TAGGER_WORKERS) must be a positive integer, "
+                f"got {self.max_workers!r}"
+            )
@@ -10,7 +10,7 @@ from .tagger import CloudTrailTagger
 from .utils import logger
 
 
-def main(region="us-east-1", hours=24):
+def main(region="us-east-1", hours=24, account_id=None):
     """Simple main function"""
 
     # Optional: Configure logging level
@@ -18,17 +18,27 @@ def main(region="us-east-1", hours=24):
 
     # Basic usage - just one line!
     logger.info("Starting CloudTrail Resource Tagger v1")
-    tagger = CloudTrailTagger(region=region)
+    tagger = CloudTrailTagger(region=region, account_id=account_id)
     result = tagger.run(hours=hours)
 
-    logger.info(f"Tagging completed! Tagged {result.stats.tagged} resources")
+    logger.info("Tagging completed! Tagged %d resources", result.stats.tagged)
     print(f"Tagged {result.stats.tagged} resources")
 
 
+def _context_account_id(context):
+    """Account ID from the Lambda function ARN, if running in Lambda"""
+    # arn:aws:lambda:<region>:<account_id>:function:<name>
+    function_arn = getattr(context, "invoked_function_arn", None)
+    if function_arn:
+        return function_arn.split(":")[4]
+    return None
+
+
 def handler(event, context):
     main(
         region=event.get("region", os.getenv("AWS_REGION", "us-east-1")),
         hours=event.get("hours", 24),
+        account_id=_context_account_id(context),
     )
     return {
         "statusCode": 200,
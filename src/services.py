@@ -5,6 +5,14 @@ Adding a new AWS service is as simple as adding a few lines here.
 Now using JMESPath for much cleaner resource extraction!
 """
 
+import logging
+import re
+from typing import Callable, List
+
+import jmespath
+from botocore.exceptions import BotoCoreError, ClientError
+from jmespath.visitor import TreeInterpreter
+
 from .utils import logger
 
 
@@ -101,7 +109,8 @@ SERVICE_CONFIGS = {
             "eventsource": "eks",
             "resource_type": "eks:nodegroup",
             "section": "responseElements",
-            "jmespath": "join('/', [nodegroup.clusterName, nodegroup.nodegroupName])",
+            # The ARN carries a generated suffix, so it can't be rebuilt
+            "jmespath": "nodegroup.nodegroupArn",
         },
     },
     "elbv2": {
@@ -211,7 +220,8 @@ SERVICE_CONFIGS = {
             "eventsource": "ecs",
             "resource_type": "ecs:service",
             "section": "responseElements",
-            "jmespath": "service.serviceName",
+            # Service ARNs include the cluster name, so take the full ARN
+            "jmespath": "service.serviceArn",
         },
     },
     "ecr": {
@@ -321,7 +331,7 @@ SERVICE_CONFIGS = {
             "eventsource": "iam",
             "resource_type": "iam:role",
             "section": "responseElements",
-            "jmespath": "role.arn",
+            "jmespath": "role.roleName",
         },
         "CreateUser": {
             "eventsource": "iam",
@@ -339,13 +349,504 @@ SERVICE_CONFIGS = {
 }
 
 
+# One interpreter shared by all compiled expressions; ParsedResult.search
+# would otherwise build a new one (and its reference cycle) per call
+_INTERPRETER = TreeInterpreter()
+
+# Plain dotted field paths like "vpc.vpcId" need no JMESPath interpreter
+_FIELD_PATH = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+def _build_extractor(expression: str) -> Callable:
+    """Build a function that evaluates a JMESPath expression on a dict"""
+    if not _FIELD_PATH.fullmatch(expression):
+        parsed = jmespath.compile(expression).parsed
+        return lambda data: _INTERPRETER.visit(parsed, data)
+
+    keys = tuple(expression.split("."))
+
+    # Most paths are a single key (e.g. "volumeId"); skip the loop for those
+    if len(keys) == 1:
+        (key,) = keys
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+
+    def extract(data):
+        for key in keys:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
+    return extract
+
+
+# Build each extractor once instead of parsing expressions on every event
+for _event_configs in SERVICE_CONFIGS.values():
+    for _config in _event_configs.values():
+        _config["extract"] = _build_extractor(_config["jmespath"])
+
+
+# Flat event name -> config index, so each event is a single dict lookup.
+# Some names exist for several services (e.g. CreateCluster); the first
+# eventsource in SERVICE_CONFIGS wins, as with the original linear scan.
+_EVENT_INDEX = {}
+for _event_configs in SERVICE_CONFIGS.values():
+    for _event_name, _config in _event_configs.items():
+        _EVENT_INDEX.setdefault(_event_name, _config)
+
+# Every event name we can tag from, for O(1) membership checks per event
+SUPPORTED_EVENTS = frozenset(_EVENT_INDEX)
+
+
+# ARN per resource type, with %s standing for the resource ID.
+# {region} and {account_id} are filled in once by build_arn_templates.
+ARN_TEMPLATES = {
+    "rds:db": "arn:aws:rds:{region}:{account_id}:db:%s",
+    "rds:cluster": "arn:aws:rds:{region}:{account_id}:cluster:%s",
+    "lambda:function": "arn:aws:lambda:{region}:{account_id}:function:%s",
+    "eks:cluster": "arn:aws:eks:{region}:{account_id}:cluster/%s",
+    "eks:nodegroup": "%s",  # already an ARN
+    "elbv2:loadbalancer": "%s",  # already an ARN
+    "elbv2:targetgroup": "%s",  # already an ARN
+    "dynamodb:table": "arn:aws:dynamodb:{region}:{account_id}:table/%s",
+    "secretsmanager:secret": "%s",  # already an ARN
+    "sns:topic": "%s",  # already an ARN
+    "cloudwatch:alarm": "arn:aws:cloudwatch:{region}:{account_id}:alarm:%s",
+    "apigateway:restapi": "arn:aws:apigateway:{region}::/restapis/%s",
+    "apigateway:apikey": "arn:aws:apigateway:{region}::/apikeys/%s",
+    "ecs:cluster": "arn:aws:ecs:{region}:{account_id}:cluster/%s",
+    "ecs:service": "%s",  # already an ARN
+    "ecr:repository": "arn:aws:ecr:{region}:{account_id}:repository/%s",
+    "stepfunctions:statemachine": "%s",  # already an ARN
+    "opensearch:domain": "arn:aws:es:{region}:{account_id}:domain/%s",
+    "redshift:cluster": "arn:aws:redshift:{region}:{account_id}:cluster:%s",
+    "cognito:userpool": "arn:aws:cognito-idp:{region}:{account_id}:userpool/%s",
+    "cognito:identitypool": "arn:aws:cognito-identity:{region}:{account_id}:identitypool/%s",
+    "amplify:app": "arn:aws:amplify:{region}:{account_id}:apps/%s",
+    "glue:database": "arn:aws:glue:{region}:{account_id}:database/%s",
+    "glue:table": "arn:aws:glue:{region}:{account_id}:table/%s",
+}
+
+# Resource types the Resource Groups Tagging API can tag in bulk by ARN
+BULK_TAG_TYPES = frozenset(
+    {
+        "rds:db",
+        "rds:cluster",
+        "lambda:function",
+        "eks:cluster",
+        "eks:nodegroup",
+        "elbv2:loadbalancer",
+        "elbv2:targetgroup",
+        "dynamodb:table",
+        "secretsmanager:secret",
+        "sns:topic",
+        "cloudwatch:alarm",
+        "ecs:cluster",
+        "ecr:repository",
+        "stepfunctions:statemachine",
+        "redshift:cluster",
+        "cognito:userpool",
+    }
+)
+
+# TagResources accepts at most 20 ARNs per call
+BULK_TAG_LIMIT = 20
+
+# EC2 CreateTags takes a list of resource IDs of any EC2 type
+EC2_TAG_TYPES = frozenset(
+    config["resource_type"] for config in SERVICE_CONFIGS["ec2"].values()
+)
+EC2_TAG_LIMIT = 1000
+
+
 def get_service_config(event_name: str) -> dict:
     """Get service configuration for an event"""
-    # Search through all eventsources for the event
-    for eventsource, events in SERVICE_CONFIGS.items():
-        if event_name in events:
-            return events[event_name]
-    return None
+    return _EVENT_INDEX.get(event_name)
+
+
+def build_arn_templates(region: str, account_id: str) -> dict:
+    """Fill region/account into ARN_TEMPLATES, leaving %s for the resource ID"""
+    return {
+        resource_type: template.format(region=region, account_id=account_id)
+        for resource_type, template in ARN_TEMPLATES.items()
+    }
+
+
+def _arn(resource_type: str, resource_id: str, clients) -> str:
+    """Build a resource ARN from the templates prepared for these clients"""
+    return clients["arns"][resource_type] % resource_id
+
+
+def _tag_dict(tags: List[dict]) -> dict:
+    """Tags as a {key: value} dict"""
+    return {tag["Key"]: tag["Value"] for tag in tags}
+
+
+def _lower_tags(tags: List[dict]) -> List[dict]:
+    """Tags as a list of {"key", "value"} dicts (ECS, Step Functions)"""
+    return [{"key": tag["Key"], "value": tag["Value"]} for tag in tags]
+
+
+def _kms_tags(tags: List[dict]) -> List[dict]:
+    """Tags as a list of {"TagKey", "TagValue"} dicts (KMS)"""
+    return [{"TagKey": tag["Key"], "TagValue": tag["Value"]} for tag in tags]
+
+
+# Per-service tagging handlers, each called as
+# handler(resource_type, resource_id, tags, clients)
+def _tag_ec2(resource_type, resource_id, tags, clients):
+    clients["ec2"].create_tags(Resources=[resource_id], Tags=tags)
+
+
+def _tag_s3(resource_type, resource_id, tags, clients):
+    clients["s3"].put_bucket_tagging(Bucket=resource_id, Tagging={"TagSet": tags})
+
+
+def _tag_rds(resource_type, resource_id, tags, clients):
+    # Handles both DB instances and clusters
+    arn = _arn(resource_type, resource_id, clients)
+    clients["rds"].add_tags_to_resource(ResourceName=arn, Tags=tags)
+
+
+def _tag_lambda(resource_type, resource_id, tags, clients):
+    arn = _arn(resource_type, resource_id, clients)
+    clients["lambda"].tag_resource(Resource=arn, Tags=_tag_dict(tags))
+
+
+def _tag_eks(resource_type, resource_id, tags, clients):
+    # EKS can be cluster or nodegroup
+    arn = _arn(resource_type, resource_id, clients)
+    clients["eks"].tag_resource(resourceArn=arn, tags=_tag_dict(tags))
+
+
+def _tag_elbv2(resource_type, resource_id, tags, clients):
+    # For ELB, resource_id is already the full ARN
+    clients["elbv2"].add_tags(ResourceArns=[resource_id], Tags=tags)
+
+
+def _tag_dynamodb(resource_type, resource_id, tags, clients):
+    clients["dynamodb"].tag_resource(
+        ResourceArn=_arn(resource_type, resource_id, clients),
+        Tags=tags,
+    )
+
+
+def _tag_kms(resource_type, resource_id, tags, clients):
+    # KMS uses key-value pairs
+    clients["kms"].tag_resource(KeyId=resource_id, Tags=_kms_tags(tags))
+
+
+def _tag_secretsmanager(resource_type, resource_id, tags, clients):
+    # Secrets Manager expects ARN and key-value tags
+    clients["secretsmanager"].tag_resource(SecretId=resource_id, Tags=tags)
+
+
+def _tag_sns(resource_type, resource_id, tags, clients):
+    # SNS expects ARN and key-value tags
+    clients["sns"].tag_resource(ResourceArn=resource_id, Tags=tags)
+
+
+def _tag_sqs(resource_type, resource_id, tags, clients):
+    # SQS expects queue URL and key-value dict
+    tag_dict = _tag_dict(tags)
+    clients["sqs"].tag_queue(QueueUrl=resource_id, Tags=tag_dict)
+
+
+def _tag_cloudwatch(resource_type, resource_id, tags, clients):
+    if resource_type == "cloudwatch:loggroup":
+        clients["cloudwatch-logs"].tag_log_group(
+            logGroupName=resource_id, tags=_tag_dict(tags)
+        )
+    else:
+        clients["cloudwatch"].tag_resource(
+            ResourceARN=_arn(resource_type, resource_id, clients),
+            Tags=tags,
+        )
+
+
+def _tag_route53(resource_type, resource_id, tags, clients):
+    # Route 53 uses resource ID and key-value tags
+    clients["route53"].change_tags_for_resource(
+        ResourceType="hostedzone",
+        ResourceId=resource_id.removeprefix("/hostedzone/"),
+        AddTags=tags,
+    )
+
+
+def _tag_apigateway(resource_type, resource_id, tags, clients):
+    # API Gateway uses resource ARN
+    tag_dict = _tag_dict(tags)
+    clients["apigateway"].tag_resource(
+        resourceArn=_arn(resource_type, resource_id, clients),
+        tags=tag_dict,
+    )
+
+
+def _tag_ecs(resource_type, resource_id, tags, clients):
+    # ECS expects ARN and key-value tags
+    clients["ecs"].tag_resource(
+        resourceArn=_arn(resource_type, resource_id, clients),
+        tags=_lower_tags(tags),
+    )
+
+
+def _tag_ecr(resource_type, resource_id, tags, clients):
+    # ECR expects ARN and key-value tags
+    clients["ecr"].tag_resource(
+        resourceArn=_arn(resource_type, resource_id, clients),
+        tags=tags,
+    )
+
+
+def _tag_stepfunctions(resource_type, resource_id, tags, clients):
+    # Step Functions expects ARN
+    clients["stepfunctions"].tag_resource(
+        resourceArn=resource_id, tags=_lower_tags(tags)
+    )
+
+
+def _tag_cloudformation(resource_type, resource_id, tags, clients):
+    # CloudFormation expects stack name and key-value tags
+    clients["cloudformation"].update_stack(
+        StackName=resource_id,
+        Tags=tags,
+        UsePreviousTemplate=True,
+    )
+
+
+def _tag_efs(resource_type, resource_id, tags, clients):
+    # EFS expects file system ID and key-value tags
+    clients["efs"].tag_resource(
+        ResourceId=resource_id,
+        Tags=tags,
+    )
+
+
+def _tag_opensearch(resource_type, resource_id, tags, clients):
+    # OpenSearch expects domain ARN
+    clients["opensearch"].add_tags(
+        ARN=_arn(resource_type, resource_id, clients),
+        TagList=tags,
+    )
+
+
+def _tag_redshift(resource_type, resource_id, tags, clients):
+    # Redshift expects resource name and key-value tags
+    clients["redshift"].create_tags(
+        ResourceName=_arn(resource_type, resource_id, clients),
+        Tags=tags,
+    )
+
+
+def _tag_cognito_idp(resource_type, resource_id, tags, clients):
+    # Cognito User Pool expects ARN
+    clients["cognito-idp"].tag_resource(
+        ResourceArn=_arn(resource_type, resource_id, clients),
+        Tags=_tag_dict(tags),
+    )
+
+
+def _tag_cognito_identity(resource_type, resource_id, tags, clients):
+    # Cognito Identity Pool expects ARN
+    clients["cognito-identity"].tag_resource(
+        ResourceArn=_arn(resource_type, resource_id, clients),
+        Tags=_tag_dict(tags),
+    )
+
+
+def _tag_amplify(resource_type, resource_id, tags, clients):
+    # Amplify expects app ARN
+    clients["amplify"].tag_resource(
+        resourceArn=_arn(resource_type, resource_id, clients),
+        tags=_tag_dict(tags),
+    )
+
+
+def _tag_glue(resource_type, resource_id, tags, clients):
+    # Glue expects ARN and key-value tags
+    clients["glue"].tag_resource(
+        ResourceArn=_arn(resource_type, resource_id, clients),
+        TagsToAdd=_tag_dict(tags),
+    )
+
+
+def _tag_iam(resource_type, resource_id, tags, clients):
+    # IAM has a tagging call per resource type
+    if resource_type == "iam:role":
+        clients["iam"].tag_role(RoleName=resource_id, Tags=tags)
+    elif resource_type == "iam:user":
+        clients["iam"].tag_user(UserName=resource_id, Tags=tags)
+    else:
+        clients["iam"].tag_policy(PolicyArn=resource_id, Tags=tags)
+
+
+# Tagging handler per event source
+_TAG_DISPATCH = {
+    "ec2": _tag_ec2,
+    "s3": _tag_s3,
+    "rds": _tag_rds,
+    "lambda": _tag_lambda,
+    "eks": _tag_eks,
+    "elbv2": _tag_elbv2,
+    "dynamodb": _tag_dynamodb,
+    "kms": _tag_kms,
+    "secretsmanager": _tag_secretsmanager,
+    "sns": _tag_sns,
+    "sqs": _tag_sqs,
+    "cloudwatch": _tag_cloudwatch,
+    "route53": _tag_route53,
+    "apigateway": _tag_apigateway,
+    "ecs": _tag_ecs,
+    "ecr": _tag_ecr,
+    "stepfunctions": _tag_stepfunctions,
+    "cloudformation": _tag_cloudformation,
+    "efs": _tag_efs,
+    "opensearch": _tag_opensearch,
+    "redshift": _tag_redshift,
+    "cognito-idp": _tag_cognito_idp,
+    "cognito-identity": _tag_cognito_identity,
+    "amplify": _tag_amplify,
+    "glue": _tag_glue,
+    "iam": _tag_iam,
+}
+
+
+def _tag_summary(tags: List[dict]) -> str:
+    """Render tags as "key:value, ..." for log messages"""
+    return ", ".join([f"{tag['Key']}:{tag['Value']}" for tag in tags])
+
+
+def build_tags(username: str, creation_time: str, config) -> List[dict]:
+    """Build the owner/creation-time/additional tags for a resource
+
+    Keys are unique; an additional tag reusing the owner or creation-time
+    key overrides it.
+    """
+    tags = {config.owner_tag_name: username}
+
+    # Add creation time tag if available
+    if creation_time:
+        tags[config.creation_time_tag_name] = creation_time
+
+    # Add additional tags
+    tags.update(config.additional_tags)
+
+    return [{"Key": key, "Value": value} for key, value in tags.items()]
+
+
+def get_batch_size(resource_type: str) -> int:
+    """How many resources of this type tag_resources sends per API call"""
+    if resource_type in BULK_TAG_TYPES:
+        return BULK_TAG_LIMIT
+    if resource_type in EC2_TAG_TYPES:
+        return EC2_TAG_LIMIT
+    return 1
+
+
+def tag_resources(
+    eventsource: str,
+    resource_type: str,
+    resource_ids: List[str],
+    username: str,
+    creation_time: str,
+    config,
+    clients,
+) -> List[bool]:
+    """Tag resources of one type with the same tags, in bulk where possible
+
+    Returns one success flag per resource ID, in order.
+    """
+    if resource_type in EC2_TAG_TYPES and len(resource_ids) > 1:
+        return _tag_ec2_batch(
+            resource_type, resource_ids, username, creation_time, config, clients
+        )
+    if resource_type not in BULK_TAG_TYPES:
+        return [
+            tag_resource(
+                eventsource,
+                resource_type,
+                resource_id,
+                username,
+                creation_time,
+                config,
+                clients,
+            )
+            for resource_id in resource_ids
+        ]
+
+    tags = build_tags(username, creation_time, config)
+    arns = [_arn(resource_type, resource_id, clients) for resource_id in resource_ids]
+    logger.debug("Bulk tagging %d %s resource(s)", len(arns), resource_type)
+
+    try:
+        response = clients["resourcegroupstaggingapi"].tag_resources(
+            ResourceARNList=arns, Tags=_tag_dict(tags)
+        )
+    except (ClientError, BotoCoreError) as e:
+        logger.error(
+            "❌ Failed to tag %d %s resource(s): %s", len(arns), resource_type, e
+        )
+        return [False] * len(arns)
+
+    failed = response.get("FailedResourcesMap", {})
+    tag_summary = _tag_summary(tags) if logger.isEnabledFor(logging.INFO) else ""
+    results = []
+    for resource_id, arn in zip(resource_ids, arns):
+        if arn in failed:
+            error = failed[arn].get("ErrorMessage", failed[arn].get("ErrorCode"))
+            logger.error(
+                "❌ Failed to tag %s:%s: %s", resource_type, resource_id, error
+            )
+            results.append(False)
+        else:
+            logger.info(
+                "✅ Tagged %s:%s with [%s]", resource_type, resource_id, tag_summary
+            )
+            results.append(True)
+    return results
+
+
+def _tag_ec2_batch(
+    resource_type: str,
+    resource_ids: List[str],
+    username: str,
+    creation_time: str,
+    config,
+    clients,
+) -> List[bool]:
+    """Tag EC2 resources with one CreateTags call, falling back to one by one"""
+    tags = build_tags(username, creation_time, config)
+    logger.debug("Bulk tagging %d %s resource(s)", len(resource_ids), resource_type)
+
+    try:
+        clients["ec2"].create_tags(Resources=resource_ids, Tags=tags)
+    except (ClientError, BotoCoreError) as e:
+        logger.warning(
+            "Batch tagging of %d %s resource(s) failed, retrying one by one: %s",
+            len(resource_ids),
+            resource_type,
+            e,
+        )
+        return [
+            tag_resource(
+                "ec2",
+                resource_type,
+                resource_id,
+                username,
+                creation_time,
+                config,
+                clients,
+            )
+            for resource_id in resource_ids
+        ]
+
+    if logger.isEnabledFor(logging.INFO):
+        tag_summary = _tag_summary(tags)
+        for resource_id in resource_ids:
+            logger.info(
+                "✅ Tagged %s:%s with [%s]", resource_type, resource_id, tag_summary
+            )
+    return [True] * len(resource_ids)
 
 
 def tag_resource(
@@ -358,242 +859,30 @@ def tag_resource(
     clients,
 ) -> bool:
     """Tag a resource - simplified logic"""
-    logger.debug(f"Tagging: {resource_type}:{resource_id}")
+    handler = _TAG_DISPATCH.get(eventsource)
+    if handler is None:
+        logger.warning("Unsupported event source: %s", eventsource)
+        return False
+
+    tags = build_tags(username, creation_time, config)
+    logger.debug("Tagging %s:%s with %d tags", resource_type, resource_id, len(tags))
+
     try:
-        # Prepare tags
-        tags = [{"Key": config.owner_tag_name, "Value": username}]
-
-        # Add creation time tag if available
-        if creation_time:
-            tags.append({"Key": config.creation_time_tag_name, "Value": creation_time})
-
-        # Add additional tags
-        if config.additional_tags:
-            for key, value in config.additional_tags.items():
-                tags.append({"Key": key, "Value": value})
-
-        logger.debug(f"Tagging {resource_type}:{resource_id} with {len(tags)} tags")
-
-        # Tag based on event source - using match-case for cleaner code
-        match eventsource:
-            case "ec2":
-                clients["ec2"].create_tags(Resources=[resource_id], Tags=tags)
-
-            case "s3":
-                clients["s3"].put_bucket_tagging(
-                    Bucket=resource_id, Tagging={"TagSet": tags}
-                )
-
-            case "rds":
-                # Handle both DB instances and clusters
-                if resource_type == "rds:cluster":
-                    arn = f"arn:aws:rds:{clients['region']}:{clients['account_id']}:cluster:{resource_id}"
-                else:
-                    arn = f"arn:aws:rds:{clients['region']}:{clients['account_id']}:db:{resource_id}"
-                clients["rds"].add_tags_to_resource(ResourceName=arn, Tags=tags)
-
-            case "lambda":
-                arn = f"arn:aws:lambda:{clients['region']}:{clients['account_id']}:function:{resource_id}"
-                clients["lambda"].tag_resource(
-                    Resource=arn, Tags={tag["Key"]: tag["Value"] for tag in tags}
-                )
-
-            case "eks":
-                # EKS can be cluster or nodegroup
-                if resource_type == "eks:cluster":
-                    arn = f"arn:aws:eks:{clients['region']}:{clients['account_id']}:cluster/{resource_id}"
-                elif resource_type == "eks:nodegroup":
-                    # resource_id format: "cluster-name/nodegroup-name"
-                    cluster_name, nodegroup_name = resource_id.split("/", 1)
-                    arn = f"arn:aws:eks:{clients['region']}:{clients['account_id']}:nodegroup/{cluster_name}/{nodegroup_name}"
-                else:
-                    arn = f"arn:aws:eks:{clients['region']}:{clients['account_id']}:cluster/{resource_id}"  # Fallback for other EKS resources
-                clients["eks"].tag_resource(
-                    resourceArn=arn, tags={tag["Key"]: tag["Value"] for tag in tags}
-                )
-
-            case "elbv2":
-                # For ELB, resource_id is already the full ARN
-                clients["elbv2"].add_tags(ResourceArns=[resource_id], Tags=tags)
-
-            case "dynamodb":
-                clients["dynamodb"].tag_resource(
-                    ResourceArn=f"arn:aws:dynamodb:{clients['region']}:{clients['account_id']}:table/{resource_id}",
-                    Tags=tags,
-                )
-
-            case "kms":
-                # KMS uses key-value pairs
-                tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                clients["kms"].tag_resource(
-                    KeyId=resource_id,
-                    Tags=[{"TagKey": k, "TagValue": v} for k, v in tag_dict.items()],
-                )
-
-            case "secretsmanager":
-                # Secrets Manager expects ARN and key-value tags
-                tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                clients["secretsmanager"].tag_resource(
-                    SecretId=resource_id,
-                    Tags=[{"Key": k, "Value": v} for k, v in tag_dict.items()],
-                )
-
-            case "sns":
-                # SNS expects ARN and key-value tags
-                tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                clients["sns"].tag_resource(
-                    ResourceArn=resource_id,
-                    Tags=[{"Key": k, "Value": v} for k, v in tag_dict.items()],
-                )
-
-            case "sqs":
-                # SQS expects queue URL and key-value dict
-                tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                clients["sqs"].tag_queue(QueueUrl=resource_id, Tags=tag_dict)
-
-            case "cloudwatch":
-                if resource_type == "cloudwatch:loggroup":
-                    tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                    clients["cloudwatch-logs"].tag_log_group(
-                        logGroupName=resource_id, tags=tag_dict
-                    )
-                else:
-                    tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                    clients["cloudwatch"].tag_resource(
-                        ResourceARN=f"arn:aws:cloudwatch:{clients['region']}:{clients['account_id']}:alarm:{resource_id}",
-                        Tags=[{"Key": k, "Value": v} for k, v in tag_dict.items()],
-                    )
-
-            case "route53":
-                # Route 53 uses resource ID and key-value tags
-                clients["route53"].change_tags_for_resource(
-                    ResourceType="hostedzone",
-                    ResourceId=resource_id.replace("/hostedzone/", ""),
-                    AddTags=[
-                        {"Key": tag["Key"], "Value": tag["Value"]} for tag in tags
-                    ],
-                )
-
-            case "apigateway":
-                # API Gateway uses resource ARN
-                tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                clients["apigateway"].tag_resource(
-                    resourceArn=f"arn:aws:apigateway:{clients['region']}::/restapis/{resource_id}",
-                    tags=tag_dict,
-                )
-
-            case "ecs":
-                # ECS expects ARN and key-value tags
-                if resource_type == "ecs:cluster":
-                    cluster_arn = f"arn:aws:ecs:{clients['region']}:{clients['account_id']}:cluster/{resource_id}"
-                else:
-                    cluster_arn = f"arn:aws:ecs:{clients['region']}:{clients['account_id']}:service/{resource_id}"
-                clients["ecs"].tag_resource(
-                    resourceArn=cluster_arn,
-                    tags=[{"key": tag["Key"], "value": tag["Value"]} for tag in tags],
-                )
-
-            case "ecr":
-                # ECR expects ARN and key-value tags
-                clients["ecr"].tag_resource(
-                    resourceArn=f"arn:aws:ecr:{clients['region']}:{clients['account_id']}:repository/{resource_id}",
-                    tags=[{"Key": tag["Key"], "Value": tag["Value"]} for tag in tags],
-                )
-
-            case "stepfunctions":
-                # Step Functions expects ARN
-                tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-                clients["stepfunctions"].tag_resource(
-                    resourceArn=resource_id,
-                    tags=[{"key": k, "value": v} for k, v in tag_dict.items()],
-                )
-
-            case "cloudformation":
-                # CloudFormation expects stack name and key-value tags
-                clients["cloudformation"].update_stack(
-                    StackName=resource_id,
-                    Tags=[{"Key": tag["Key"], "Value": tag["Value"]} for tag in tags],
-                    UsePreviousTemplate=True,
-                )
-
-            case "efs":
-                # EFS expects file system ID and key-value tags
-                clients["efs"].tag_resource(
-                    ResourceId=resource_id,
-                    Tags=[{"Key": tag["Key"], "Value": tag["Value"]} for tag in tags],
-                )
-
-            case "opensearch":
-                # OpenSearch expects domain ARN
-                clients["opensearch"].add_tags(
-                    ARN=f"arn:aws:es:{clients['region']}:{clients['account_id']}:domain/{resource_id}",
-                    TagList=[
-                        {"Key": tag["Key"], "Value": tag["Value"]} for tag in tags
-                    ],
-                )
-
-            case "redshift":
-                # Redshift expects resource name and key-value tags
-                clients["redshift"].create_tags(
-                    ResourceName=f"arn:aws:redshift:{clients['region']}:{clients['account_id']}:cluster:{resource_id}",
-                    Tags=[{"Key": tag["Key"], "Value": tag["Value"]} for tag in tags],
-                )
-
-            case "cognito-idp":
-                # Cognito User Pool expects ARN
-                clients["cognito-idp"].tag_resource(
-                    ResourceArn=f"arn:aws:cognito-idp:{clients['region']}:{clients['account_id']}:userpool/{resource_id}",
-                    Tags={tag["Key"]: tag["Value"] for tag in tags},
-                )
-
-            case "cognito-identity":
-                # Cognito Identity Pool expects ARN
-                clients["cognito-identity"].tag_resource(
-                    ResourceArn=f"arn:aws:cognito-identity:{clients['region']}:{clients['account_id']}:identitypool/{resource_id}",
-                    Tags={tag["Key"]: tag["Value"] for tag in tags},
-                )
-
-            case "amplify":
-                # Amplify expects app ARN
-                clients["amplify"].tag_resource(
-                    resourceArn=f"arn:aws:amplify:{clients['region']}:{clients['account_id']}:apps/{resource_id}",
-                    tags={tag["Key"]: tag["Value"] for tag in tags},
-                )
-
-            case "glue":
-                # Glue expects ARN and key-value tags
-                if resource_type == "glue:database":
-                    resource_arn = f"arn:aws:glue:{clients['region']}:{clients['account_id']}:database/{resource_id}"
-                else:
-                    resource_arn = f"arn:aws:glue:{clients['region']}:{clients['account_id']}:table/{resource_id}"
-                clients["glue"].tag_resource(
-                    ResourceArn=resource_arn,
-                    TagsToAdd={tag["Key"]: tag["Value"] for tag in tags},
-                )
-
-            case "iam":
-                # IAM expects ARN and key-value tags
-                clients["iam"].tag_resource(
-                    ResourceArn=resource_id,
-                    Tags=[{"Key": tag["Key"], "Value": tag["Value"]} for tag in tags],
-                )
-
-            case _:
-                logger.warning(f"Unsupported event source: {eventsource}")
-                return False
-
-        tag_summary = ", ".join([f"{tag['Key']}:{tag['Value']}" for tag in tags])
-        logger.info(f"✅ Tagged {resource_type}:{resource_id} with [{tag_summary}]")
-        return True
-
-    except Exception as e:
-        logger.error(f"❌ Failed to tag {resource_type}:{resource_id}: {e}")
+        handler(resource_type, resource_id, tags, clients)
+    except (ClientError, BotoCoreError) as e:
+        logger.error("❌ Failed to tag %s:%s: %s", resource_type, resource_id, e)
         return False
 
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "✅ Tagged %s:%s with [%s]",
+            resource_type,
+            resource_id,
+            _tag_summary(tags),
+        )
+    return True
+
 
-def get_supported_events():
-    """Get list of supported events - simple!"""
-    events = []
-    for eventsource, event_configs in SERVICE_CONFIGS.items():
-        events.extend(event_configs.keys())
-    return events
+def get_supported_events() -> frozenset:
+    """Get the set of supported event names - simple!"""
+    return SUPPORTED_EVENTS
@@ -4,99 +4,180 @@ Simplified CloudTrail Resource Tagger - Clean and Concise
 This replaces the original 450-line tagger.py with something much simpler.
 """
 
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
-from .services import get_service_config, tag_resource
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+from .services import (
+    get_batch_size,
+    get_service_config,
+    tag_resources,
+)
 from .clients import get_clients
-from .utils import logger
+from .utils import json_loads, logger
 from .data import TaggingStats, ResourceInfo, EventProcessingResult, TaggingConfig
 
 
+@lru_cache(maxsize=1024)
+def _format_datetime(event_time: datetime, time_format: str) -> str:
+    """Format a UTC datetime
+
+    Cached because bursts of events share the same creation time.
+    """
+    return event_time.strftime(time_format)
+
+
+@lru_cache(maxsize=1024)
+def _format_iso(event_time: str, time_format: str) -> str:
+    """Format an ISO 8601 timestamp string from CloudTrail in UTC, cached like above"""
+    parsed = datetime.fromisoformat(event_time)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime(time_format)
+
+
+def format_creation_time(event_time, time_format: str = "%Y-%m-%d %H:%M:%S UTC") -> str:
+    """Format a CloudTrail event time as UTC in the given format"""
+    if not event_time:
+        return None
+
+    try:
+        if isinstance(event_time, datetime):
+            if event_time.tzinfo is None:
+                event_time = event_time.replace(tzinfo=timezone.utc)
+            return _format_datetime(event_time.astimezone(timezone.utc), time_format)
+        else:
+            # Parse ISO format from CloudTrail
+            return _format_iso(str(event_time), time_format)
+    except (ValueError, AttributeError) as e:
+        logger.warning("Could not format creation time %s: %s", event_time, e)
+        return str(event_time)
+
+
 class CloudTrailTagger:
     """Simplified CloudTrail Resource Tagger"""
 
-    def __init__(self, region: str = "us-east-1", config: TaggingConfig = None):
+    def __init__(
+        self,
+        region: str = "us-east-1",
+        config: TaggingConfig = None,
+        account_id: Optional[str] = None,
+    ):
         self.region = region
         self.config = config or TaggingConfig()
-        self.clients = get_clients(region)
+        self.clients = get_clients(region, account_id)
 
     def run(self, hours: int = 24) -> EventProcessingResult:
         """Main execution - much simpler than before"""
         start_time = datetime.now(timezone.utc)
-        logger.info(f"Starting CloudTrail resource tagging for region {self.region}")
-        logger.info(f"Looking back {hours} hours for events")
-
-        # Get events
-        events = self._get_events(hours)
-        if not events:
-            logger.warning("No CloudTrail events found")
-            return self._empty_result(start_time)
-
-        logger.info(f"Found {len(events)} CloudTrail events to process")
+        start_ts = time.monotonic()
+        logger.info("Starting CloudTrail resource tagging for region %s", self.region)
+        logger.info("Looking back %s hours for events", hours)
 
-        # Process events
+        # Process events as they are paged in
         stats = TaggingStats()
-        resources_info = []
-
-        for event in events:
+        # (service_config, creation_time, resource_type, resource_id,
+        #  event_name, username, event_time) per resource to tag
+        pending = []
+        queued = {}  # (resource_type, resource_id) -> index in pending
+
+        # Bind loop-invariant lookups once rather than per event
+        extract_resource_ids = self._extract_resource_ids
+        time_format = self.config.creation_time_format
+        queue = pending.append
+        debug = logger.isEnabledFor(logging.DEBUG)
+        events_by_name = Counter()  # supported events that yielded resources
+
+        for event in self._iter_events(hours):
             stats.processed += 1
-            event_name = event.get("EventName", "")
-            username = event.get("Username", "Unknown")
+            try:
+                # CloudTrail always sets EventName; Username may be absent
+                event_name = event["EventName"]
+            except KeyError:
+                if debug:
+                    logger.debug("Skipping event without EventName")
+                continue
+            username = event["Username"] if "Username" in event else "Unknown"
 
             # Check if we support this event
             service_config = get_service_config(event_name)
-            if not service_config:
-                logger.debug(f"Skipping unsupported event: {event_name}")
+            if service_config is None:
+                if debug:
+                    logger.debug("Skipping unsupported event: %s", event_name)
                 continue
 
             # Extract resource IDs (can be multiple!)
-            resource_ids = self._extract_resource_ids(event, service_config)
+            resource_ids = extract_resource_ids(event, service_config)
             if not resource_ids:
-                logger.debug(f"No resource IDs found in event: {event_name}")
+                if debug:
+                    logger.debug("No resource IDs found in event: %s", event_name)
                 continue
 
-            logger.info(
-                f"Processing {event_name} by {username} - found {len(resource_ids)} resource(s)"
-            )
+            events_by_name[event_name] += 1
+            if debug:
+                logger.debug(
+                    "Processing %s by %s - found %d resource(s)",
+                    event_name,
+                    username,
+                    len(resource_ids),
+                )
 
-            # Extract creation time from event
-            creation_time = self._format_creation_time(event.get("EventTime"))
+            # Extract creation time once per event, shared by all its resources
+            event_time = event.get("EventTime")
+            creation_time = format_creation_time(event_time, time_format)
 
-            # Tag each resource
+            # Queue each resource for tagging
             for resource_id in resource_ids:
-                success = tag_resource(
-                    service_config["eventsource"],
-                    service_config["resource_type"],
-                    resource_id,
-                    username,
+                key = (service_config["resource_type"], resource_id)
+                item = (
+                    service_config,
                     creation_time,
-                    self.config,
-                    self.clients,
+                    *key,
+                    event_name,
+                    username,
+                    event_time,
                 )
+                index = queued.get(key)
+                if index is None:
+                    queued[key] = len(pending)
+                    queue(item)
+                    continue
+
+                # A resource can show up in several events; tag it once, from
+                # the earliest one (events arrive newest first)
+                earlier = pending[index][6]
+                if event_time is not None and (earlier is None or event_time < earlier):
+                    pending[index] = item
+                elif debug:
+                    logger.debug("Skipping already queued resource: %s:%s", *key)
+
+        if not stats.processed:
+            logger.warning("No CloudTrail events found")
+            return self._empty_result(start_time, start_ts)
 
-                # Track results
-                if success:
-                    stats.tagged += 1
-                else:
-                    stats.errors += 1
-
-                resources_info.append(
-                    ResourceInfo(
-                        resource_type=service_config["resource_type"],
-                        resource_id=resource_id,
-                        event_name=event_name,
-                        username=username,
-                        event_time=event.get("EventTime"),
-                        tagged=success,
-                    )
-                )
+        logger.info(
+            "Found %d CloudTrail events, queued %d resource(s) from %d event(s): %s",
+            stats.processed,
+            len(pending),
+            events_by_name.total(),
+            dict(events_by_name.most_common()),
+        )
+
+        resources_info = self._tag_resources(pending, stats)
 
         end_time = datetime.now(timezone.utc)
-        duration = (end_time - start_time).total_seconds()
+        end_ts = time.monotonic()
+        duration = end_ts - start_ts
 
-        logger.info(f"Tagging completed in {duration:.2f} seconds")
+        logger.info("Tagging completed in %.2f seconds", duration)
         logger.info(
-            f"Summary: {stats.processed} events processed, {stats.tagged} resources tagged, {stats.errors} errors"
+            "Summary: %d events processed, %d resources tagged, %d errors",
+            stats.processed,
+            stats.tagged,
+            stats.errors,
         )
 
         return EventProcessingResult(
@@ -105,16 +186,84 @@ class CloudTrailTagger:
             start_time=start_time,
             end_time=end_time,
             region=self.region,
+            start_ts=start_ts,
+            end_ts=end_ts,
         )
 
-    def _get_events(self, hours: int) -> List[Dict]:
-        """Get CloudTrail events - simplified"""
+    def _tag_resources(
+        self, pending: List[tuple], stats: TaggingStats
+    ) -> List[ResourceInfo]:
+        """Tag queued resources concurrently - boto3 clients are thread-safe"""
+        # Resources sharing a type and tag values can be tagged together
+        groups = {}
+        for item in pending:
+            _, creation_time, resource_type, _, _, username, _ = item
+            key = (resource_type, username, creation_time)
+            groups.setdefault(key, []).append(item)
+
+        batches = []
+        for (resource_type, _, _), items in groups.items():
+            size = get_batch_size(resource_type)
+            batches.extend(items[i : i + size] for i in range(0, len(items), size))
+
+        tagged = {}  # (resource_type, resource_id) -> success
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+            # Track results
+            for batch, results in zip(batches, pool.map(self._tag_batch, batches)):
+                for item, success in zip(batch, results):
+                    tagged[item[2], item[3]] = success
+                    if success:
+                        stats.tagged += 1
+                    else:
+                        stats.errors += 1
+
+        if not self.config.collect_resources:
+            return []
+
+        # Report resources in the order they were queued
+        resources_info = []
+        for item in pending:
+            _, _, resource_type, resource_id, event_name, username, event_time = item
+            resources_info.append(
+                ResourceInfo(
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    event_name=event_name,
+                    username=username,
+                    event_time=event_time,
+                    tagged=tagged[resource_type, resource_id],
+                )
+            )
+        return resources_info
+
+    def _tag_batch(self, batch: List[tuple]) -> List[bool]:
+        """Tag a batch of queued resources that share type and tags"""
+        service_config, creation_time, resource_type, _, _, username, _ = batch[0]
+        try:
+            return tag_resources(
+                service_config["eventsource"],
+                resource_type,
+                [item[3] for item in batch],
+                username,
+                creation_time,
+                self.config,
+                self.clients,
+            )
+        except Exception as e:
+            # A broken handler must not abort the other batches
+            logger.error(
+                "❌ Failed to tag %d %s resource(s): %s", len(batch), resource_type, e
+            )
+            return [False] * len(batch)
+
+    def _iter_events(self, hours: int) -> Iterator[Dict]:
+        """Yield CloudTrail events page by page"""
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours)
 
-        logger.debug(f"Querying CloudTrail events from {start_time} to {end_time}")
+        logger.debug("Querying CloudTrail events from %s to %s", start_time, end_time)
 
-        events = []
+        count = 0
         paginator = self.clients["cloudtrail"].get_paginator("lookup_events")
 
         try:
@@ -124,27 +273,26 @@ class CloudTrailTagger:
                 LookupAttributes=[
                     {"AttributeKey": "ReadOnly", "AttributeValue": "false"}
                 ],
+                # LookupEvents returns at most 50 events per call
+                PaginationConfig={"PageSize": 50},
             ):
-                events.extend(page["Events"])
-                logger.debug(f"Retrieved {len(page['Events'])} events from this page")
+                logger.debug("Retrieved %d events from this page", len(page["Events"]))
+                count += len(page["Events"])
+                yield from page["Events"]
         except Exception as e:
-            logger.error(f"Error fetching CloudTrail events: {e}")
-            return []
+            logger.error("Error fetching CloudTrail events: %s", e)
+            return
 
-        logger.debug(f"Total CloudTrail events retrieved: {len(events)}")
-        return events
+        logger.debug("Total CloudTrail events retrieved: %d", count)
 
     def _extract_resource_ids(self, event: Dict, config: Dict) -> List[str]:
         """Extract resource IDs from event using JMESPath - much cleaner!"""
-        import json
-        import jmespath
-
         try:
-            cloud_trail_event = json.loads(event.get("CloudTrailEvent", "{}"))
+            cloud_trail_event = json_loads(event.get("CloudTrailEvent") or "{}")
             section = cloud_trail_event.get(config["section"], {})
 
-            # Use JMESPath for clean extraction
-            result = jmespath.search(config["jmespath"], section)
+            # Use the prebuilt JMESPath extractor
+            result = config["extract"](section)
 
             # Handle both single values and lists
             if isinstance(result, list):
@@ -154,30 +302,12 @@ class CloudTrailTagger:
             else:
                 return []
         except Exception as e:
-            logger.error(f"Error extracting with JMESPath: {e}")
+            logger.error("Error extracting with JMESPath: %s", e)
             return []
 
-    def _format_creation_time(
-        self, event_time, time_format: str = "%Y-%m-%d %H:%M:%S UTC"
-    ) -> str:
-        """Format creation time from CloudTrail event to a given format"""
-        if not event_time:
-            return None
-
-        try:
-            if isinstance(event_time, datetime):
-                return event_time.strftime(time_format)
-            else:
-                # Parse ISO format from CloudTrail
-                parsed_time = datetime.fromisoformat(
-                    str(event_time).replace("Z", "+00:00")
-                )
-                return parsed_time.strftime(time_format)
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Could not format creation time {event_time}: {e}")
-            return str(event_time)
-
-    def _empty_result(self, start_time: datetime) -> EventProcessingResult:
+    def _empty_result(
+        self, start_time: datetime, start_ts: float
+    ) -> EventProcessingResult:
         """Create empty result"""
         return EventProcessingResult(
             stats=TaggingStats(),
@@ -185,4 +315,6 @@ class CloudTrailTagger:
             start_time=start_time,
             end_time=datetime.now(timezone.utc),
             region=self.region,
+            start_ts=start_ts,
+            end_ts=time.monotonic(),
         )
@@ -4,6 +4,12 @@ Utilities for AWS CloudTrail Resource Tagger v1
 
 import logging
 
+try:
+    # orjson parses CloudTrail event payloads several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # noqa: F401
+
 
 # Configure logger for v1 package
 def setup_logger(level=logging.INFO):
@@ -0,0 +1,33 @@
+from src import clients as clients_module
+
+
+class FakeSession:
+    def __init__(self):
+        self.created = []
+
+    def client(self, name, **kwargs):
+        self.created.append(name)
+        return self
+
+    def get_caller_identity(self):
+        return {"Account": "123456789012"}
+
+
+def test_account_id_looked_up_once_through_shared_session(monkeypatch):
+    monkeypatch.delenv("AWS_ACCOUNT_ID", raising=False)
+    monkeypatch.setattr(clients_module, "_ACCOUNT_ID", None)
+    session = FakeSession()
+
+    assert clients_module._account_id(session) == "123456789012"
+    assert clients_module._account_id(FakeSession()) == "123456789012"
+    assert session.created == ["sts"]
+
+
+def test_unknown_client_key_raises_key_error():
+    clients = clients_module.LazyClients(FakeSession(), "us-east-1", "123")
+    assert "foo" not in clients
+    assert clients.get("foo") is None
+    assert clients.session.created == []
+
+    clients["cloudwatch-logs"]
+    assert clients.session.created == ["logs"]
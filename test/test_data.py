@@ -0,0 +1,23 @@
+import pytest
+
+from src.data import TaggingConfig
+
+
+def test_max_workers_from_env(monkeypatch):
+    monkeypatch.delenv("AWS_TAGGER_WORKERS", raising=False)
+    assert TaggingConfig().max_workers == 16
+
+    # Read per config, so changes after import are picked up
+    monkeypatch.setenv("AWS_TAGGER_WORKERS", "4")
+    assert TaggingConfig().max_workers == 4
+
+    for value in ("", "abc", "0", "-1"):
+        monkeypatch.setenv("AWS_TAGGER_WORKERS", value)
+        with pytest.raises(ValueError, match="AWS_TAGGER_WORKERS"):
+            TaggingConfig()
+
+
+def test_explicit_max_workers_is_validated():
+    assert TaggingConfig(max_workers=2).max_workers == 2
+    with pytest.raises(ValueError, match="max_workers"):
+        TaggingConfig(max_workers=0)
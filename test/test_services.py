@@ -0,0 +1,99 @@
+from src.data import TaggingConfig
+from src.services import (
+    ARN_TEMPLATES,
+    SERVICE_CONFIGS,
+    build_arn_templates,
+    build_tags,
+    get_batch_size,
+    get_service_config,
+    get_supported_events,
+)
+
+
+def test_service_config_lookup():
+    for event_configs in SERVICE_CONFIGS.values():
+        for event_name in event_configs:
+            assert event_name in get_supported_events()
+            assert get_service_config(event_name) is not None
+
+    assert get_service_config("DeleteBucket") is None
+
+
+def test_shared_event_name_keeps_first_eventsource():
+    # CreateCluster is configured for eks, ecs and redshift
+    assert get_service_config("CreateCluster")["eventsource"] == "eks"
+
+
+def test_extractors():
+    ec2 = get_service_config("RunInstances")
+    section = {
+        "instancesSet": {"items": [{"instanceId": "i-1"}, {"instanceId": "i-2"}]}
+    }
+    assert ec2["extract"](section) == ["i-1", "i-2"]
+
+    vpc = get_service_config("CreateVpc")
+    assert vpc["extract"]({"vpc": {"vpcId": "vpc-1"}}) == "vpc-1"
+    assert vpc["extract"]({"vpc": None}) is None
+    assert vpc["extract"]({}) is None
+
+    volume = get_service_config("CreateVolume")
+    assert volume["extract"]({"volumeId": "vol-1"}) == "vol-1"
+    assert volume["extract"]({}) is None
+    assert volume["extract"](None) is None
+
+    elb = get_service_config("CreateLoadBalancer")
+    section = {"loadBalancers": [{"loadBalancerArn": "a1"}, {"loadBalancerArn": "a2"}]}
+    assert elb["extract"](section) == ["a1", "a2"]
+    assert elb["extract"]({}) is None
+
+    nodegroup = get_service_config("CreateNodegroup")
+    section = {"nodegroup": {"nodegroupArn": "arn:aws:eks:r:1:nodegroup/c/n/id"}}
+    assert nodegroup["extract"](section) == "arn:aws:eks:r:1:nodegroup/c/n/id"
+
+
+def test_arn_templates():
+    arns = build_arn_templates("eu-west-1", "123")
+    assert set(arns) == set(ARN_TEMPLATES)
+    assert arns["rds:db"] % "db1" == "arn:aws:rds:eu-west-1:123:db:db1"
+    assert arns["eks:cluster"] % "c" == "arn:aws:eks:eu-west-1:123:cluster/c"
+    assert arns["sns:topic"] % "arn:aws:sns:x" == "arn:aws:sns:x"
+    assert (
+        arns["apigateway:apikey"] % "k1" == "arn:aws:apigateway:eu-west-1::/apikeys/k1"
+    )
+    assert arns["ecs:service"] % "arn:aws:ecs:x" == "arn:aws:ecs:x"
+
+
+def test_batch_sizes():
+    assert get_batch_size("ec2:instance") == 1000
+    assert get_batch_size("lambda:function") == 20
+    assert get_batch_size("s3:bucket") == 1
+
+
+def test_build_tags_keys_are_unique():
+    config = TaggingConfig(additional_tags={"owner": "team", "env": "dev"})
+    tags = build_tags("alice", "2024-01-02", config)
+    assert tags == [
+        {"Key": "owner", "Value": "team"},
+        {"Key": "created_at", "Value": "2024-01-02"},
+        {"Key": "env", "Value": "dev"},
+    ]
+
+
+def test_build_tags_follow_config_changes():
+    config = TaggingConfig()
+    config.additional_tags["team"] = "x"
+    assert {"Key": "team", "Value": "x"} in build_tags("alice", None, config)
+
+    config = TaggingConfig(additional_tags={"a": "1"})
+    config.additional_tags = {"b": "2"}
+    assert build_tags("alice", None, config) == [
+        {"Key": "owner", "Value": "alice"},
+        {"Key": "b", "Value": "2"},
+    ]
+
+
+def test_build_tags_returns_fresh_dicts():
+    config = TaggingConfig(additional_tags={"env": "dev"})
+    first = build_tags("alice", None, config)
+    second = build_tags("bob", None, config)
+    assert not {id(tag) for tag in first} & {id(tag) for tag in second}
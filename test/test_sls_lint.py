@@ -14,13 +14,15 @@ def test_validate_sls_policy():
         action for statement in sls_role["statements"] for action in statement["Action"]
     ]
 
-    missing_services = []
-    for service in clients:
-        for action in actions:
-            if re.search(service, action):
-                break
-        else:
-            missing_services.append(service)
+    # One alternation scanned once per action, longest names first. Matches
+    # don't overlap, so a service found only inside another service's match
+    # doesn't count: each service needs an action naming it on its own
+    by_length = sorted(clients, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(service) for service in by_length))
+    matched = set()
+    for action in actions:
+        matched.update(pattern.findall(action))
+    missing_services = [service for service in clients if service not in matched]
 
     if missing_services:
         assert False, (
@@ -0,0 +1,278 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src import tagger as tagger_module
+from src.data import TaggingConfig
+from src.services import build_arn_templates
+from src.tagger import CloudTrailTagger, format_creation_time
+
+REGION = "us-east-1"
+ACCOUNT = "123456789012"
+T1 = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+T2 = datetime(2024, 1, 2, 3, 4, 6, tzinfo=timezone.utc)
+
+
+def _lambda_arn(name):
+    return f"arn:aws:lambda:{REGION}:{ACCOUNT}:function:{name}"
+
+
+def _event(event_name, username, event_time, section, payload):
+    return {
+        "EventName": event_name,
+        "Username": username,
+        "EventTime": event_time,
+        "CloudTrailEvent": json.dumps({section: payload}),
+    }
+
+
+def _lambda_event(name, username="alice", event_time=T1):
+    return _event(
+        "CreateFunction20150331",
+        username,
+        event_time,
+        "requestParameters",
+        {"functionName": name},
+    )
+
+
+def _ec2_event(instance_ids, username="alice", event_time=T1):
+    items = [{"instanceId": instance_id} for instance_id in instance_ids]
+    return _event(
+        "RunInstances",
+        username,
+        event_time,
+        "responseElements",
+        {"instancesSet": {"items": items}},
+    )
+
+
+class FakeCloudTrail:
+    def __init__(self, events):
+        self.events = events
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, **kwargs):
+        for i in range(0, len(self.events), 50):
+            yield {"Events": self.events[i : i + 50]}
+
+
+class FakeTaggingApi:
+    """Records TagResources calls; fails listed ARNs or whole calls"""
+
+    def __init__(self, failed_arns=(), failing_prefix=None):
+        self.calls = []
+        self.failed_arns = set(failed_arns)
+        self.failing_prefix = failing_prefix
+
+    def tag_resources(self, ResourceARNList, Tags):
+        self.calls.append((list(ResourceARNList), Tags))
+        if self.failing_prefix and ResourceARNList[0].startswith(self.failing_prefix):
+            raise ClientError(
+                {"Error": {"Code": "AccessDenied", "Message": "denied"}},
+                "TagResources",
+            )
+        return {
+            "FailedResourcesMap": {
+                arn: {"ErrorCode": "InvalidParameterException"}
+                for arn in ResourceARNList
+                if arn in self.failed_arns
+            }
+        }
+
+
+class FakeEc2:
+    """Records CreateTags calls; any call naming a bad ID is rejected"""
+
+    def __init__(self, bad_ids=()):
+        self.calls = []
+        self.bad_ids = set(bad_ids)
+
+    def create_tags(self, Resources, Tags):
+        self.calls.append(list(Resources))
+        if self.bad_ids & set(Resources):
+            raise ClientError(
+                {"Error": {"Code": "InvalidInstanceID.NotFound", "Message": "gone"}},
+                "CreateTags",
+            )
+
+
+@pytest.fixture
+def make_tagger(monkeypatch):
+    def make(events, **clients):
+        fake_clients = {
+            "region": REGION,
+            "account_id": ACCOUNT,
+            "arns": build_arn_templates(REGION, ACCOUNT),
+            "cloudtrail": FakeCloudTrail(events),
+            **clients,
+        }
+        monkeypatch.setattr(tagger_module, "get_clients", lambda *args: fake_clients)
+        return CloudTrailTagger(REGION, TaggingConfig(max_workers=1), ACCOUNT)
+
+    return make
+
+
+def test_bulk_tagging_groups_batches_and_maps_failures(make_tagger):
+    alice = [f"fn-{i}" for i in range(22)]
+    events = [_lambda_event(name) for name in alice]
+    events.append(_lambda_event("fn-bob", username="bob"))
+    events.append(_lambda_event("fn-late", event_time=T2))
+    api = FakeTaggingApi(failed_arns=[_lambda_arn("fn-3")])
+
+    result = make_tagger(events, resourcegroupstaggingapi=api).run()
+
+    # Split by (type, owner, creation time), then into batches of 20
+    arn_lists = [arns for arns, _ in api.calls]
+    assert arn_lists == [
+        [_lambda_arn(name) for name in alice[:20]],
+        [_lambda_arn(name) for name in alice[20:]],
+        [_lambda_arn("fn-bob")],
+        [_lambda_arn("fn-late")],
+    ]
+    assert api.calls[0][1] == {
+        "owner": "alice",
+        "created_at": "2024-01-02 03:04:05 UTC",
+    }
+    assert api.calls[2][1]["owner"] == "bob"
+    assert api.calls[3][1]["created_at"] == "2024-01-02 03:04:06 UTC"
+
+    # Only the ARN listed in FailedResourcesMap is reported as failed
+    assert result.stats.processed == len(events)
+    assert result.stats.tagged == len(events) - 1
+    assert result.stats.errors == 1
+    assert [r.resource_id for r in result.resources] == [
+        *alice,
+        "fn-bob",
+        "fn-late",
+    ]
+    assert [r.resource_id for r in result.resources if not r.tagged] == ["fn-3"]
+
+
+def test_bulk_tagging_call_error_fails_whole_batch(make_tagger):
+    events = [
+        _lambda_event("fn-1"),
+        _event(
+            "CreateDBInstance",
+            "alice",
+            T1,
+            "requestParameters",
+            {"dBInstanceIdentifier": "db-1"},
+        ),
+        _lambda_event("fn-2"),
+    ]
+    api = FakeTaggingApi(failing_prefix=f"arn:aws:rds:{REGION}")
+
+    result = make_tagger(events, resourcegroupstaggingapi=api).run()
+
+    assert (result.stats.tagged, result.stats.errors) == (2, 1)
+    # Results stay in queue order even though batches are grouped by type
+    assert [(r.resource_id, r.tagged) for r in result.resources] == [
+        ("fn-1", True),
+        ("db-1", False),
+        ("fn-2", True),
+    ]
+
+
+def test_collect_resources_off_keeps_stats_only(make_tagger):
+    api = FakeTaggingApi()
+    tagger = make_tagger([_lambda_event("fn-1")], resourcegroupstaggingapi=api)
+    tagger.config.collect_resources = False
+
+    result = tagger.run()
+
+    assert result.resources == []
+    assert result.stats.tagged == 1
+
+
+def test_ec2_batch_falls_back_to_single_calls(make_tagger):
+    ec2 = FakeEc2(bad_ids=["i-bad"])
+    events = [_ec2_event(["i-1", "i-bad", "i-2"])]
+
+    result = make_tagger(events, ec2=ec2).run()
+
+    # The batch is rejected, then every ID is retried on its own
+    assert ec2.calls == [["i-1", "i-bad", "i-2"], ["i-1"], ["i-bad"], ["i-2"]]
+    assert [(r.resource_id, r.tagged) for r in result.resources] == [
+        ("i-1", True),
+        ("i-bad", False),
+        ("i-2", True),
+    ]
+    assert (result.stats.tagged, result.stats.errors) == (2, 1)
+
+
+def test_creation_time_is_utc_for_datetimes_and_iso_strings():
+    offset = datetime.fromisoformat("2024-01-02T05:04:05+02:00")
+    expected = "2024-01-02 03:04:05 UTC"
+    assert format_creation_time(offset) == expected
+    assert format_creation_time("2024-01-02T05:04:05+02:00") == expected
+    assert format_creation_time("2024-01-02T03:04:05Z") == expected
+    assert format_creation_time("2024-01-02T03:04:05") == expected
+
+
+class FakeIam:
+    def __init__(self):
+        self.calls = []
+
+    def tag_role(self, **kwargs):
+        self.calls.append(("tag_role", kwargs["RoleName"]))
+
+    def tag_user(self, **kwargs):
+        self.calls.append(("tag_user", kwargs["UserName"]))
+
+    def tag_policy(self, **kwargs):
+        self.calls.append(("tag_policy", kwargs["PolicyArn"]))
+
+
+def test_broken_handler_fails_only_its_own_batch(make_tagger):
+    iam = FakeIam()
+    events = [
+        _event(
+            "CreateRole", "alice", T1, "responseElements", {"role": {"roleName": "r1"}}
+        ),
+        _event("CreateBucket", "alice", T1, "requestParameters", {"bucketName": "b1"}),
+        _lambda_event("fn-1"),
+    ]
+
+    # The fake S3 client has no put_bucket_tagging, so its handler raises
+    result = make_tagger(
+        events, iam=iam, s3=object(), resourcegroupstaggingapi=FakeTaggingApi()
+    ).run()
+
+    assert iam.calls == [("tag_role", "r1")]
+    assert [(r.resource_id, r.tagged) for r in result.resources] == [
+        ("r1", True),
+        ("b1", False),
+        ("fn-1", True),
+    ]
+    assert (result.stats.tagged, result.stats.errors) == (2, 1)
+
+
+def test_duplicate_resource_tagged_from_earliest_event(make_tagger):
+    api = FakeTaggingApi()
+    # LookupEvents returns newest first: bob re-put the alarm after alice made it
+    events = [
+        _event("PutMetricAlarm", "bob", T2, "requestParameters", {"alarmName": "a1"}),
+        _event("PutMetricAlarm", "alice", T1, "requestParameters", {"alarmName": "a1"}),
+    ]
+
+    result = make_tagger(events, resourcegroupstaggingapi=api).run()
+
+    assert len(api.calls) == 1
+    assert api.calls[0][1] == {
+        "owner": "alice",
+        "created_at": "2024-01-02 03:04:05 UTC",
+    }
+    assert [(r.resource_id, r.username) for r in result.resources] == [("a1", "alice")]
+
+
+def test_creation_time_keeps_microseconds_on_both_paths():
+    fmt = "%Y-%m-%d %H:%M:%S.%f"
+    when = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    expected = "2024-01-02 03:04:05.123456"
+    assert format_creation_time(when, fmt) == expected
+    assert format_creation_time(when.isoformat(), fmt) == expected
@@ -5,13 +5,65 @@ Usage: python ts.py <service> <resource_id> <username> [region]
 """
 
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from src.clients import get_clients
-from src.services import tag_resource
-from src.utils import logger
+from src.services import get_service_config, tag_resource
+from src.tagger import format_creation_time
+from src.utils import json_loads, logger
 from src.data import TaggingConfig
 
 
+# Eventsource that tags each resource type, built once rather than per resource
+_EVENTSOURCE_MAP = {
+    "ec2:instance": "ec2",
+    "ec2:volume": "ec2",
+    "ec2:security-group": "ec2",
+    "ec2:vpc": "ec2",
+    "ec2:subnet": "ec2",
+    "ec2:snapshot": "ec2",
+    "ec2:image": "ec2",
+    "ec2:elastic-ip": "ec2",
+    "lambda:function": "lambda",
+    "s3:bucket": "s3",
+    "rds:db": "rds",
+    "rds:cluster": "rds",
+    "eks:cluster": "eks",
+    "eks:nodegroup": "eks",
+    "elbv2:loadbalancer": "elbv2",
+    "elbv2:targetgroup": "elbv2",
+    "dynamodb:table": "dynamodb",
+    "kms:key": "kms",
+    "kms:alias": "kms",
+    "secretsmanager:secret": "secretsmanager",
+    "sns:topic": "sns",
+    "sqs:queue": "sqs",
+    "cloudwatch:loggroup": "cloudwatch",
+    "cloudwatch:alarm": "cloudwatch",
+    "route53:hostedzone": "route53",
+    "apigateway:restapi": "apigateway",
+    "apigateway:apikey": "apigateway",
+    "ecs:cluster": "ecs",
+    "ecs:service": "ecs",
+    "ecr:repository": "ecr",
+    "stepfunctions:statemachine": "stepfunctions",
+    "cloudformation:stack": "cloudformation",
+    "efs:filesystem": "efs",
+    "opensearch:domain": "opensearch",
+    "redshift:cluster": "redshift",
+    "cognito:userpool": "cognito-idp",
+    "cognito:identitypool": "cognito-identity",
+    "amplify:app": "amplify",
+    "cloudfront:distribution": "cloudfront",
+    "glue:database": "glue",
+    "glue:table": "glue",
+    "bedrock:model": "bedrock",
+    "iam:role": "iam",
+    "iam:user": "iam",
+    "iam:policy": "iam",
+}
+
+
 def test_tag_resource(
     service: str,
     username: str = "test-user",
@@ -32,185 +84,124 @@ def test_tag_resource(
         # Get AWS clients
         clients = get_clients(region)
 
-        # Get CloudTrail events for the specified service
-        events = _get_cloudtrail_events(clients, service, hours)
-
-        if not events:
-            logger.warning(f"No CloudTrail events found for service: {service}")
-            return False
+        # Tag resources concurrently as they are extracted from the events,
+        # so API calls overlap with paging - boto3 clients are thread-safe
+        config = TaggingConfig()
+        futures = {}
+        event_count = 0
 
-        logger.info(f"Found {len(events)} CloudTrail events for {service}")
+        with ThreadPoolExecutor(max_workers=config.max_workers) as pool:
+            for event in _get_cloudtrail_events(clients, service, hours):
+                event_count += 1
+                event_name = event.get("EventName", "")
 
-        # Process each event and extract resource IDs
-        resources_found = []
+                # Get service config for this event
+                service_config = get_service_config(event_name)
 
-        for event in events:
-            event_name = event.get("EventName", "")
-            event_username = event.get("Username", username)
-            creation_time = _format_creation_time(event.get("EventTime"))
+                if not service_config:
+                    logger.debug("No service config for event: %s", event_name)
+                    continue
 
-            # Get service config for this event
-            from src.services import get_service_config
+                # Extract resource IDs from the event
+                resource_ids = _extract_resource_ids_from_event(event, service_config)
+                if not resource_ids:
+                    continue
 
-            service_config = get_service_config(event_name)
+                event_username = event.get("Username", username)
+                creation_time = format_creation_time(event.get("EventTime"))
+                resource_type = service_config["resource_type"]
 
-            if not service_config:
-                logger.debug(f"No service config for event: {event_name}")
-                continue
+                # Determine the correct eventsource from resource_type
+                eventsource = _EVENTSOURCE_MAP.get(resource_type, service)
 
-            # Extract resource IDs from the event
-            resource_ids = _extract_resource_ids_from_event(event, service_config)
-
-            if resource_ids:
                 for resource_id in resource_ids:
-                    resources_found.append(
-                        {
-                            "resource_id": resource_id,
-                            "resource_type": service_config["resource_type"],
-                            "event_name": event_name,
-                            "username": event_username,
-                            "creation_time": creation_time,
-                        }
+                    logger.info("Tagging %s:%s", resource_type, resource_id)
+                    future = pool.submit(
+                        tag_resource,
+                        eventsource=eventsource,
+                        resource_type=resource_type,
+                        resource_id=resource_id,
+                        username=event_username,
+                        creation_time=creation_time,
+                        clients=clients,
+                        config=config,
                     )
+                    futures[future] = resource_id
+
+            if not event_count:
+                logger.warning("No CloudTrail events found for service: %s", service)
+                return False
 
-        if not resources_found:
-            logger.warning(f"No resources found in CloudTrail events for {service}")
-            return False
-
-        logger.info(f"Found {len(resources_found)} resources to tag")
-
-        # Tag each resource found
-        success_count = 0
-        for resource in resources_found:
-            logger.info(
-                f"Tagging {resource['resource_type']}:{resource['resource_id']}"
-            )
-
-            # Determine the correct eventsource from resource_type
-            eventsource_map = {
-                "ec2:instance": "ec2",
-                "ec2:volume": "ec2",
-                "ec2:security-group": "ec2",
-                "ec2:vpc": "ec2",
-                "ec2:subnet": "ec2",
-                "ec2:snapshot": "ec2",
-                "ec2:image": "ec2",
-                "ec2:elastic-ip": "ec2",
-                "lambda:function": "lambda",
-                "s3:bucket": "s3",
-                "rds:db": "rds",
-                "rds:cluster": "rds",
-                "eks:cluster": "eks",
-                "eks:nodegroup": "eks",
-                "elbv2:loadbalancer": "elbv2",
-                "elbv2:targetgroup": "elbv2",
-                "dynamodb:table": "dynamodb",
-                "kms:key": "kms",
-                "kms:alias": "kms",
-                "secretsmanager:secret": "secretsmanager",
-                "sns:topic": "sns",
-                "sqs:queue": "sqs",
-                "cloudwatch:loggroup": "cloudwatch",
-                "cloudwatch:alarm": "cloudwatch",
-                "route53:hostedzone": "route53",
-                "apigateway:restapi": "apigateway",
-                "apigateway:apikey": "apigateway",
-                "ecs:cluster": "ecs",
-                "ecs:service": "ecs",
-                "ecr:repository": "ecr",
-                "stepfunctions:statemachine": "stepfunctions",
-                "cloudformation:stack": "cloudformation",
-                "efs:filesystem": "efs",
-                "opensearch:domain": "opensearch",
-                "redshift:cluster": "redshift",
-                "cognito:userpool": "cognito-idp",
-                "cognito:identitypool": "cognito-identity",
-                "amplify:app": "amplify",
-                "cloudfront:distribution": "cloudfront",
-                "glue:database": "glue",
-                "glue:table": "glue",
-                "bedrock:model": "bedrock",
-                "iam:role": "iam",
-                "iam:user": "iam",
-                "iam:policy": "iam",
-            }
-
-            correct_eventsource = eventsource_map.get(
-                resource["resource_type"], service
-            )
-
-            success = tag_resource(
-                eventsource=correct_eventsource,
-                resource_type=resource["resource_type"],
-                resource_id=resource["resource_id"],
-                username=resource["username"],
-                creation_time=resource["creation_time"],
-                clients=clients,
-                config=TaggingConfig(),
-            )
-
-            if success:
-                success_count += 1
-                logger.info(f"✅ Successfully tagged {resource['resource_id']}")
-            else:
-                logger.error(f"❌ Failed to tag {resource['resource_id']}")
+            logger.info("Found %d CloudTrail events for %s", event_count, service)
+
+            if not futures:
+                logger.warning(
+                    "No resources found in CloudTrail events for %s", service
+                )
+                return False
+
+            logger.info("Found %d resources to tag", len(futures))
+
+            # Collect results as the tagging calls finish
+            success_count = 0
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                    logger.info("✅ Successfully tagged %s", futures[future])
+                else:
+                    logger.error("❌ Failed to tag %s", futures[future])
 
         logger.info(
-            f"Tagging test completed: {success_count}/{len(resources_found)} resources tagged successfully"
+            "Tagging test completed: %d/%d resources tagged successfully",
+            success_count,
+            len(futures),
         )
         return success_count > 0
 
     except Exception as e:
-        logger.error(f"❌ Test failed with exception: {e}")
+        logger.error("❌ Test failed with exception: %s", e)
         return False
 
 
 def _get_cloudtrail_events(clients, service: str, hours: int):
-    """Get CloudTrail events for a specific service"""
-    from datetime import datetime, timedelta
-
+    """Yield CloudTrail events for a specific service page by page"""
     end_time = datetime.now(timezone.utc)
     start_time = end_time - timedelta(hours=hours)
 
     logger.debug(
-        f"Querying CloudTrail events for {service} from {start_time} to {end_time}"
+        "Querying CloudTrail events for %s from %s to %s", service, start_time, end_time
     )
 
-    events = []
     paginator = clients["cloudtrail"].get_paginator("lookup_events")
 
     try:
         for page in paginator.paginate(
             StartTime=start_time,
             EndTime=end_time,
+            # LookupEvents takes a single lookup attribute; scope by service
             LookupAttributes=[
-                {"AttributeKey": "ReadOnly", "AttributeValue": "false"},
                 {
                     "AttributeKey": "EventSource",
                     "AttributeValue": f"{service}.amazonaws.com",
                 },
             ],
+            # LookupEvents returns at most 50 events per call
+            PaginationConfig={"PageSize": 50},
         ):
-            events.extend(page["Events"])
-            logger.debug(f"Retrieved {len(page['Events'])} events from this page")
+            logger.debug("Retrieved %d events from this page", len(page["Events"]))
+            yield from page["Events"]
     except Exception as e:
-        logger.error(f"Error fetching CloudTrail events: {e}")
-        return []
-
-    return events
+        logger.error("Error fetching CloudTrail events: %s", e)
 
 
 def _extract_resource_ids_from_event(event, service_config):
     """Extract resource IDs from CloudTrail event using JMESPath"""
-    import json
-    import jmespath
-
     try:
-        cloud_trail_event = json.loads(event.get("CloudTrailEvent", "{}"))
+        cloud_trail_event = json_loads(event.get("CloudTrailEvent") or "{}")
         section = cloud_trail_event.get(service_config["section"], {})
 
-        # Use JMESPath for clean extraction
-        result = jmespath.search(service_config["jmespath"], section)
+        # Use the extractor precompiled from the JMESPath expression
+        result = service_config["extract"](section)
 
         # Handle both single values and lists
         if isinstance(result, list):
@@ -220,27 +211,10 @@ def _extract_resource_ids_from_event(event, service_config):
         else:
             return []
     except Exception as e:
-        logger.error(f"Error extracting with JMESPath: {e}")
+        logger.error("Error extracting with JMESPath: %s", e)
         return []
 
 
-def _format_creation_time(event_time):
-    """Format creation time from CloudTrail event"""
-    if not event_time:
-        return None
-
-    try:
-        if isinstance(event_time, datetime):
-            return event_time.strftime("%Y-%m-%d %H:%M:%S UTC")
-        else:
-            # Parse ISO format from CloudTrail
-            parsed_time = datetime.fromisoformat(str(event_time).replace("Z", "+00:00"))
-            return parsed_time.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except (ValueError, AttributeError) as e:
-        logger.warning(f"Could not format creation time {event_time}: {e}")
-        return str(event_time)
-
-
 def main():
     """Main function to handle command line arguments"""
     if len(sys.argv) < 2: